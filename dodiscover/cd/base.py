@@ -1,9 +1,12 @@
+import itertools
+import os
+import tempfile
 from abc import ABCMeta, abstractmethod
 from typing import Callable, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, dump, effective_n_jobs, load
 from numpy.typing import ArrayLike
 from sklearn.linear_model import LogisticRegression
 
@@ -135,6 +138,10 @@ class BaseConditionalDiscrepancyTest(metaclass=ABCMeta):
         """Abstract method for computing the test statistic."""
         pass
 
+    def _statistic_batch(self, X: ArrayLike, Y: ArrayLike, group_inds: ArrayLike) -> list:
+        """Compute the test statistic for a batch of permuted group labels."""
+        return [self._statistic(X, Y, group_ind) for group_ind in group_inds]
+
     def compute_null(
         self, e_hat: ArrayLike, X: ArrayLike, Y: ArrayLike, null_reps: int = 1000, random_state=None
     ) -> ArrayLike:
@@ -162,13 +169,51 @@ class BaseConditionalDiscrepancyTest(metaclass=ABCMeta):
 
         n_samps = X.shape[0]
 
+        # draw the resampled group labels for every permutation in a single
+        # vectorized call rather than one RNG invocation per repetition
+        group_inds = rng.binomial(1, e_hat, size=(null_reps, n_samps))
+
         # compute the test statistic on the conditionally permuted
         # dataset, where each group label is resampled for each sample
         # according to its propensity score
-        null_dist = Parallel(n_jobs=self.n_jobs)(
-            [
-                delayed(self._statistic)(X, Y, rng.binomial(1, e_hat, size=n_samps))
-                for _ in range(null_reps)
-            ]
-        )
+        use_memmap = self.n_jobs is not None and self.n_jobs != 1
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpdir:
+            if use_memmap:
+                # dump the large arrays once and hand every worker a read-only
+                # memmap, instead of pickling a fresh copy of X and Y into
+                # each of the ``null_reps`` dispatched tasks
+                X_fpath = os.path.join(tmpdir, "X.joblib")
+                Y_fpath = os.path.join(tmpdir, "Y.joblib")
+                dump(X, X_fpath)
+                dump(Y, Y_fpath)
+                X = load(X_fpath, mmap_mode="r")
+                Y = load(Y_fpath, mmap_mode="r")
+
+            # dispatch chunks of repetitions per task rather than one task per
+            # repetition, so joblib's per-task overhead is amortized over many
+            # cheap statistic evaluations
+            n_tasks = effective_n_jobs(self.n_jobs)
+            batch_size = max(1, null_reps // (4 * n_tasks))
+            batches = Parallel(n_jobs=self.n_jobs, return_as="generator")(
+                delayed(self._statistic_batch)(X, Y, group_inds[idx : idx + batch_size])
+                for idx in range(0, null_reps, batch_size)
+            )
+
+            # stream finished batches straight into a preallocated array, so
+            # completed tasks and their captured arguments are released eagerly
+            # instead of accumulating in an intermediate list
+            null_dist = np.fromiter(
+                itertools.chain.from_iterable(batches), dtype=float, count=null_reps
+            )
+
+            if use_memmap:
+                # close the memory maps before the directory is removed; on
+                # Windows, rmtree cannot delete files that are still mapped
+                # (ignore_cleanup_errors above is the fallback should a worker
+                # still hold a handle)
+                for arr in (X, Y):
+                    mmap = getattr(arr, "_mmap", None)
+                    if mmap is not None:
+                        mmap.close()
+                del X, Y
         return null_dist
@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 from numpy.typing import ArrayLike
 
-from dodiscover.ci.kernel_utils import corrent_matrix, von_neumann_divergence
+from dodiscover.ci.kernel_utils import compute_kernel, von_neumann_divergence
 from dodiscover.typing import Column
 
 from .base import BaseConditionalDiscrepancyTest
@@ -25,6 +25,10 @@ class BregmanCDTest(BaseConditionalDiscrepancyTest):
     kwidth : float, optional
         The width of the kernel, by default None, which we will then estimate
         using the default procedure in :func:`dodiscover.ci.kernel_utils.compute_kernel`.
+    eig_tol : float, optional
+        If given, eigenvalues of the correntropy matrices below this value are
+        discarded when evaluating the Von Neumann divergences, by default None,
+        which keeps the full spectra.
     null_reps : int, optional
         Number of times to sample null distribution, by default 1000.
     n_jobs : int, optional
@@ -41,6 +45,11 @@ class BregmanCDTest(BaseConditionalDiscrepancyTest):
         will build a propensity model using the argument in ``propensity_model``.
     random_state : int, optional
         Random seed, by default None.
+    dtype : dtype, optional
+        The floating point dtype used for the precomputed feature-pair kernels,
+        by default ``np.float64``. Using ``np.float32`` halves the memory held
+        by the kernel stack at the cost of precision, which is typically
+        immaterial given the resolution of the permutation pvalue.
 
     Notes
     -----
@@ -56,18 +65,22 @@ class BregmanCDTest(BaseConditionalDiscrepancyTest):
         metric: str = "rbf",
         distance_metric: str = "euclidean",
         kwidth: Optional[float] = None,
+        eig_tol: Optional[float] = None,
         null_reps: int = 1000,
         n_jobs: Optional[int] = None,
         propensity_model=None,
         propensity_est=None,
         random_state: Optional[int] = None,
+        dtype=np.float64,
     ) -> None:
         self.metric = metric
         self.distance_metric = distance_metric
         self.kwidth = kwidth
+        self.eig_tol = eig_tol
         self.null_reps = null_reps
         self.n_jobs = n_jobs
         self.random_state = random_state
+        self.dtype = dtype
 
         self.propensity_model = propensity_model
         self.propensity_est = propensity_est
@@ -90,13 +103,17 @@ class BregmanCDTest(BaseConditionalDiscrepancyTest):
             raise RuntimeError(f"Group indications in {group_col_var} column should be all 1 or 0.")
 
         # get the X and Y dataset
-        X = df[x_cols].to_numpy()
-        Y = df[y_cols].to_numpy()
+        X = df[x_cols].to_numpy(dtype=self.dtype)
+        Y = df[y_cols].to_numpy(dtype=self.dtype)
+
+        # precompute the full-sample kernels for each feature pair once; the
+        # per-group correntropy matrices are then just masked reductions of these
+        self._corrent_kernels_ = self._precompute_corrent_kernels(X, Y)
 
         # We are interested in testing: P_1(y|x) = P_2(y|x)
         # compute the conditional divergence, which is symmetric by construction
         # 1/2 * (D(p_1(y|x) || p_2(y|x)) + D(p_2(y|x) || p_1(y|x)))
-        conditional_div = self._statistic(X, Y, group_ind)
+        conditional_div = self._statistic_from_kernels(*self._corrent_kernels_, group_ind)
 
         # compute propensity scores
         e_hat = self._compute_propensity_scores(group_ind, K=X)
@@ -107,46 +124,249 @@ class BregmanCDTest(BaseConditionalDiscrepancyTest):
         )
         self.null_dist_ = null_dist
 
+        # the kernel stacks are O((n_features_x + n_features_y)^2 * n_samples^2)
+        # floats; release them now that the null distribution is computed so
+        # they do not stay pinned for the lifetime of the test object
+        del self._corrent_kernels_
+
         # compute pvalue
         pvalue = (1.0 + np.sum(null_dist >= conditional_div)) / (1 + self.null_reps)
         return conditional_div, pvalue
 
+    def compute_null(
+        self, e_hat: ArrayLike, X: ArrayLike, Y: ArrayLike, null_reps: int = 1000, random_state=None
+    ) -> ArrayLike:
+        """Estimate null distribution using propensity weights.
+
+        Overrides the base implementation to reuse the full-sample correntropy
+        kernels across all permutations. Since the per-permutation work is then
+        only O(n^2) masked reductions, the null distribution is computed in a
+        plain loop without dispatching joblib tasks.
+
+        Parameters
+        ----------
+        e_hat : Array-like of shape (n_samples,)
+            The predicted propensity score for ``group_ind == 1``.
+        X : Array-Like of shape (n_samples, n_features_x)
+            The X (covariates) array.
+        Y : Array-Like of shape (n_samples, n_features_y)
+            The Y (outcomes) array.
+        null_reps : int, optional
+            Number of times to sample null, by default 1000.
+        random_state : int, optional
+            Random generator, or random seed, by default None.
+
+        Returns
+        -------
+        null_dist : Array-like of shape (n_samples,)
+            The null distribution of test statistics.
+        """
+        rng = np.random.default_rng(random_state)
+
+        n_samps = X.shape[0]
+
+        # reuse the kernels computed in test() when available; otherwise build them
+        kernels = getattr(self, "_corrent_kernels_", None)
+        if kernels is None or kernels[0].shape[-1] != n_samps:
+            kernels = self._precompute_corrent_kernels(X, Y)
+
+        kernels_x, kernels_xy = kernels
+
+        # draw all permuted label vectors at once and batch the correntropy
+        # reductions over the whole batch; only the small per-rep divergence
+        # computations remain in the Python loop
+        group_inds = rng.binomial(1, e_hat, size=(null_reps, n_samps))
+        first_groups = group_inds == 0
+        second_groups = group_inds == 1
+
+        Cx1y1 = self._corrent_matrices_batch(kernels_xy, first_groups)
+        Cx2y2 = self._corrent_matrices_batch(kernels_xy, second_groups)
+        Cx1 = self._corrent_matrices_batch(kernels_x, first_groups)
+        Cx2 = self._corrent_matrices_batch(kernels_x, second_groups)
+
+        null_dist = np.array(
+            [
+                self._conditional_divergence(Cx1y1[idx], Cx2y2[idx], Cx1[idx], Cx2[idx])
+                for idx in range(null_reps)
+            ]
+        )
+        return null_dist
+
     def _statistic(self, X: ArrayLike, Y: ArrayLike, group_ind: ArrayLike) -> float:
+        kernels_x, kernels_xy = self._precompute_corrent_kernels(X, Y)
+        return self._statistic_from_kernels(kernels_x, kernels_xy, group_ind)
+
+    def _statistic_from_kernels(
+        self, kernels_x: ArrayLike, kernels_xy: ArrayLike, group_ind: ArrayLike
+    ) -> float:
+        """Compute the conditional divergence from precomputed feature-pair kernels.
+
+        Parameters
+        ----------
+        kernels_x : ArrayLike of shape (n_features_x, n_features_x, n_samples, n_samples)
+            Full-sample kernels between each pair of X features.
+        kernels_xy : ArrayLike of shape (n_features, n_features, n_samples, n_samples)
+            Full-sample kernels between each pair of (X, Y) features.
+        group_ind : ArrayLike of shape (n_samples,)
+            The group indicator of 1's and 0's.
+
+        Returns
+        -------
+        conditional_div : float
+            The conditional divergence test statistic.
+        """
         first_group = group_ind == 0
         second_group = group_ind == 1
-        X1 = X[first_group, :]
-        X2 = X[second_group, :]
-        Y1 = Y[first_group, :]
-        Y2 = Y[second_group, :]
 
         # first compute the centered correntropy matrices, C_xy^1
-        Cx1y1 = corrent_matrix(np.hstack((X1, Y1)), kwidth=self.kwidth)
-        Cx2y2 = corrent_matrix(np.hstack((X2, Y2)), kwidth=self.kwidth)
+        Cx1y1 = self._corrent_matrix_from_kernels(kernels_xy, first_group)
+        Cx2y2 = self._corrent_matrix_from_kernels(kernels_xy, second_group)
 
         # compute the centered correntropy matrices for just C_x^1 and C_x^2
-        Cx1 = corrent_matrix(
-            X1,
-            metric=self.metric,
-            distance_metric=self.distance_metric,
-            kwidth=self.kwidth,
-            n_jobs=self.n_jobs,
-        )
-        Cx2 = corrent_matrix(
-            X2,
-            metric=self.metric,
-            distance_metric=self.distance_metric,
-            kwidth=self.kwidth,
-            n_jobs=self.n_jobs,
-        )
+        Cx1 = self._corrent_matrix_from_kernels(kernels_x, first_group)
+        Cx2 = self._corrent_matrix_from_kernels(kernels_x, second_group)
+
+        return self._conditional_divergence(Cx1y1, Cx2y2, Cx1, Cx2)
 
+    def _conditional_divergence(
+        self, Cx1y1: ArrayLike, Cx2y2: ArrayLike, Cx1: ArrayLike, Cx2: ArrayLike
+    ) -> float:
+        """Combine correntropy matrices into the symmetric conditional divergence."""
         # compute the conditional divergence with the Von Neumann div
         # D(p_1(y|x) || p_2(y|x))
-        joint_div1 = von_neumann_divergence(Cx1y1, Cx2y2)
-        joint_div2 = von_neumann_divergence(Cx2y2, Cx1y1)
-        x_div1 = von_neumann_divergence(Cx1, Cx2)
-        x_div2 = von_neumann_divergence(Cx2, Cx1)
+        joint_div1 = von_neumann_divergence(Cx1y1, Cx2y2, eig_tol=self.eig_tol)
+        joint_div2 = von_neumann_divergence(Cx2y2, Cx1y1, eig_tol=self.eig_tol)
+        x_div1 = von_neumann_divergence(Cx1, Cx2, eig_tol=self.eig_tol)
+        x_div2 = von_neumann_divergence(Cx2, Cx1, eig_tol=self.eig_tol)
 
         # compute the conditional divergence, which is symmetric by construction
         # 1/2 * (D(p_1(y|x) || p_2(y|x)) + D(p_2(y|x) || p_1(y|x)))
         conditional_div = 1.0 / 2 * (joint_div1 - x_div1 + joint_div2 - x_div2)
         return conditional_div
+
+    def _precompute_corrent_kernels(
+        self, X: ArrayLike, Y: ArrayLike
+    ) -> Tuple[ArrayLike, ArrayLike]:
+        """Precompute full-sample kernels for each feature pair of X and (X, Y).
+
+        The centered correntropy matrix of any sample subset only requires the
+        diagonal and a masked sum of the kernel between two feature columns
+        evaluated on all samples. Computing these kernels once means each
+        permutation of the group labels avoids re-evaluating any kernel.
+
+        Parameters
+        ----------
+        X : ArrayLike of shape (n_samples, n_features_x)
+            The X (covariates) array.
+        Y : ArrayLike of shape (n_samples, n_features_y)
+            The Y (outcomes) array.
+
+        Returns
+        -------
+        kernels_x : ArrayLike of shape (n_features_x, n_features_x, n_samples, n_samples)
+            Full-sample kernels between each pair of X features.
+        kernels_xy : ArrayLike of shape (n_features, n_features, n_samples, n_samples)
+            Full-sample kernels between each pair of (X, Y) features.
+        """
+        kernels_x = self._pairwise_feature_kernels(X)
+        kernels_xy = self._pairwise_feature_kernels(np.hstack((X, Y)))
+        return kernels_x, kernels_xy
+
+    def _pairwise_feature_kernels(self, data: ArrayLike) -> ArrayLike:
+        """Compute the uncentered kernel between every pair of feature columns."""
+        n_samples, n_features = data.shape
+        kernels = np.zeros(shape=(n_features, n_features, n_samples, n_samples), dtype=self.dtype)
+
+        # as in corrent_matrix, the kernel width estimated from the first feature
+        # pair is reused for the remaining pairs
+        kwidth = self.kwidth
+        for idx in range(n_features):
+            for jdx in range(idx + 1):
+                K, kwidth = compute_kernel(
+                    data[:, idx][:, np.newaxis],
+                    data[:, jdx][:, np.newaxis],
+                    metric=self.metric,
+                    distance_metric=self.distance_metric,
+                    kwidth=kwidth,
+                    centered=False,
+                    n_jobs=self.n_jobs,
+                )
+                kernels[idx, jdx] = K
+                kernels[jdx, idx] = K.T
+        return kernels
+
+    def _corrent_matrix_from_kernels(self, kernels: ArrayLike, mask: ArrayLike) -> ArrayLike:
+        """Compute the centered correntropy matrix of a sample subset.
+
+        Reduces the precomputed full-sample feature-pair kernels over the samples
+        selected by ``mask``, mirroring :func:`dodiscover.ci.kernel_utils.corrent_matrix`.
+
+        Parameters
+        ----------
+        kernels : ArrayLike of shape (n_features, n_features, n_samples, n_samples)
+            Full-sample kernels between each pair of features.
+        mask : ArrayLike of shape (n_samples,)
+            Boolean mask selecting the samples of one group.
+
+        Returns
+        -------
+        corren_arr : ArrayLike of shape (n_features, n_features)
+            A symmetric centered correntropy matrix of the masked data.
+        """
+        n_features = kernels.shape[0]
+        n_samples = int(mask.sum())
+        mask_vec = mask.astype(float)
+        corren_arr = np.zeros(shape=(n_features, n_features))
+
+        for idx in range(n_features):
+            for jdx in range(idx + 1):
+                K = kernels[idx, jdx]
+
+                # compute the bias due to finite-samples
+                bias = mask_vec @ K @ mask_vec / n_samples**2
+
+                # compute the sample centered correntropy
+                corren = (1.0 / n_samples) * np.sum(K.diagonal()[mask]) - bias
+
+                corren_arr[idx, jdx] = corren_arr[jdx, idx] = corren
+        return corren_arr
+
+    def _corrent_matrices_batch(self, kernels: ArrayLike, masks: ArrayLike) -> ArrayLike:
+        """Compute centered correntropy matrices for a batch of sample subsets.
+
+        Batched version of :meth:`_corrent_matrix_from_kernels`: the diagonal
+        sums and bilinear forms for all permutations are computed with single
+        matrix products per feature pair, instead of one Python-level reduction
+        per permutation.
+
+        Parameters
+        ----------
+        kernels : ArrayLike of shape (n_features, n_features, n_samples, n_samples)
+            Full-sample kernels between each pair of features.
+        masks : ArrayLike of shape (n_reps, n_samples)
+            Boolean masks selecting the samples of one group, one row per
+            permutation of the labels.
+
+        Returns
+        -------
+        corren_arrs : ArrayLike of shape (n_reps, n_features, n_features)
+            The centered correntropy matrices, one per permutation.
+        """
+        n_features = kernels.shape[0]
+        n_reps = masks.shape[0]
+        mask_vecs = masks.astype(float)
+        counts = mask_vecs.sum(axis=1)
+        corren_arrs = np.zeros(shape=(n_reps, n_features, n_features))
+
+        for idx in range(n_features):
+            for jdx in range(idx + 1):
+                K = kernels[idx, jdx]
+
+                # compute the bias due to finite-samples for every permutation
+                bias = np.sum((mask_vecs @ K) * mask_vecs, axis=1) / counts**2
+
+                # compute the sample centered correntropy for every permutation
+                corren = mask_vecs @ K.diagonal() / counts - bias
+
+                corren_arrs[:, idx, jdx] = corren_arrs[:, jdx, idx] = corren
+        return corren_arrs
@@ -3,6 +3,7 @@ from typing import Set, Tuple
 import numpy as np
 import pandas as pd
 from numpy.typing import ArrayLike
+from scipy.linalg import cho_factor, cho_solve
 
 from dodiscover.ci.kernel_utils import _default_regularization, compute_kernel
 from dodiscover.typing import Column
@@ -29,7 +30,9 @@ class KernelCDTest(BaseConditionalDiscrepancyTest):
         respectively, by default None. If a single number, then the same l2 regularization
         will be applied to inverting both matrices. If ``None``, then a default
         regularization will be computed that chooses the value that minimizes the upper bound
-        on the mean squared prediction error.
+        on the mean squared prediction error. The default is computed once per ``test``
+        call from the observed group partition and held fixed across the null
+        permutations.
     kwidth_x : float, optional
         Kernel width among X variables, by default None, which we will then estimate
         using the median l2 distance between the X variables.
@@ -52,6 +55,12 @@ class KernelCDTest(BaseConditionalDiscrepancyTest):
         will build a propensity model using the argument in ``propensity_model``.
     random_state : int, optional
         Random seed, by default None.
+    dtype : dtype, optional
+        The floating point dtype used for the kernel matrices, by default
+        ``np.float64``. Using ``np.float32`` halves the memory footprint and
+        roughly doubles BLAS throughput of the statistic at the cost of
+        precision, which is typically immaterial given the resolution of the
+        permutation pvalue.
 
     Notes
     -----
@@ -75,11 +84,13 @@ class KernelCDTest(BaseConditionalDiscrepancyTest):
         propensity_model=None,
         propensity_est=None,
         random_state=None,
+        dtype=np.float64,
     ) -> None:
         self.l2 = l2
         self.n_jobs = n_jobs
         self.random_state = random_state
         self.null_reps = null_reps
+        self.dtype = dtype
 
         self.kwidth_x = kwidth_x
         self.kwidth_y = kwidth_y
@@ -107,28 +118,21 @@ class KernelCDTest(BaseConditionalDiscrepancyTest):
             raise RuntimeError(f"Group indications in {group_col_var} column should be all 1 or 0.")
 
         # compute kernel for the X and Y data
-        X = df[x_cols].to_numpy()
-        Y = df[y_cols].to_numpy()
-        K, sigma_x = compute_kernel(
-            X,
-            distance_metric=self.distance_metric,
-            metric=self.metric,
-            kwidth=self.kwidth_x,
-            n_jobs=self.n_jobs,
-        )
-        L, sigma_y = compute_kernel(
-            Y,
-            distance_metric=self.distance_metric,
-            metric=self.metric,
-            kwidth=self.kwidth_y,
-            n_jobs=self.n_jobs,
-        )
+        K, sigma_x = self._cached_kernel(df, x_cols, self.kwidth_x)
+        L, sigma_y = self._cached_kernel(df, y_cols, self.kwidth_y)
+
+        # kernel centering upcasts to float64, so cast back if a lower
+        # precision was requested
+        K = K.astype(self.dtype, copy=False)
+        L = L.astype(self.dtype, copy=False)
 
         # store fitted attributes
         self.kwidth_x_ = sigma_x
         self.kwidth_y_ = sigma_y
 
-        # compute the statistic
+        # compute the statistic; this also sets the regularization factors
+        # from the observed group partition, which the null permutations reuse
+        self.regs_ = None
         stat = self._statistic(K, L, group_ind)
 
         # compute propensity scores
@@ -144,80 +148,95 @@ class KernelCDTest(BaseConditionalDiscrepancyTest):
         pvalue = (1 + np.sum(null_dist >= stat)) / (1 + self.null_reps)
         return stat, pvalue
 
+    def _cached_kernel(self, df: pd.DataFrame, cols: list, kwidth) -> Tuple[ArrayLike, float]:
+        """Compute the kernel of a column subset, caching across ``test`` calls.
+
+        Constraint-based discovery invokes the same test object many times on
+        overlapping column subsets of one dataframe; the pairwise-distance and
+        kernel evaluation for a given subset is identical each time. Kernels
+        are therefore cached per column subset for the most recently seen
+        dataframe, which assumes the dataframe is not mutated between calls.
+        """
+        # a reference to the dataframe is kept so the identity check below
+        # cannot be confused by id reuse of a garbage-collected frame
+        if getattr(self, "_kernel_cache_df_", None) is not df:
+            self._kernel_cache_df_ = df
+            self._kernel_cache_: dict = {}
+
+        key = (tuple(sorted(cols, key=str)), kwidth)
+        if key not in self._kernel_cache_:
+            data = df[cols].to_numpy(dtype=self.dtype)
+            self._kernel_cache_[key] = compute_kernel(
+                data,
+                distance_metric=self.distance_metric,
+                metric=self.metric,
+                kwidth=kwidth,
+                n_jobs=self.n_jobs,
+            )
+        return self._kernel_cache_[key]
+
+    def __getstate__(self):
+        # joblib pickles the test object into every dispatched null-permutation
+        # task; ship it without the kernel cache, which holds full copies of
+        # the kernels and a reference to the cached dataframe
+        state = self.__dict__.copy()
+        state.pop("_kernel_cache_", None)
+        state.pop("_kernel_cache_df_", None)
+        return state
+
     def _statistic(self, K: ArrayLike, L: ArrayLike, group_ind: ArrayLike) -> float:
         n_samples = len(K)
 
-        # compute W matrices from K and z
-        W0, W1 = self._compute_inverse_kernel(K, group_ind)
+        # compute the group partition only once per permutation and share it with
+        # the kernel factorization, since it fully determines the sub-matrices
+        first_mask = group_ind == 0
+
+        # reorder samples into contiguous group blocks with a single gather per
+        # kernel; every sub-matrix below is then a contiguous view instead of a
+        # separate np.ix_ gather, and the statistic is invariant to sample order
+        perm = np.concatenate((np.flatnonzero(first_mask), np.flatnonzero(~first_mask)))
+        n0 = int(first_mask.sum())
+        K_perm = K[perm][:, perm]
+        L_perm = L[perm][:, perm]
+
+        # compute regularization factors once per test invocation from the
+        # observed partition; recomputing the SVD-based default for every null
+        # permutation would cost as much as the statistic itself
+        if getattr(self, "regs_", None) is None:
+            self._get_regs(K_perm[:n0, :n0], K_perm[n0:, n0:])
+
+        # factor the regularized kernel blocks; solving against the Cholesky
+        # factors below replaces the explicit inverse W matrices of the KCD
+        # test at roughly half the flops and without materializing an inverse
+        cho0 = cho_factor(K_perm[:n0, :n0] + self.regs_[0] * np.identity(n0), lower=True)
+        cho1 = cho_factor(
+            K_perm[n0:, n0:] + self.regs_[1] * np.identity(n_samples - n0), lower=True
+        )
 
         # compute L kernels
-        first_mask = np.array(1 - group_ind, dtype=bool)
-        second_mask = np.array(group_ind, dtype=bool)
-        L0 = L[np.ix_(first_mask, first_mask)]
-        L1 = L[np.ix_(second_mask, second_mask)]
-        L01 = L[np.ix_(first_mask, second_mask)]
+        L0 = L_perm[:n0, :n0]
+        L1 = L_perm[n0:, n0:]
+        L01 = L_perm[:n0, n0:]
 
         # compute the final test statistic
-        K0 = K[:, first_mask]
-        K1 = K[:, second_mask]
-        KW0 = K0 @ W0
-        KW1 = K1 @ W1
+        K0 = K_perm[:, :n0]
+        K1 = K_perm[:, n0:]
 
-        # compute the three terms in Lemma 4.4
-        first_term = np.trace(KW0.T @ KW0 @ L0)
-        second_term = np.trace(KW1.T @ KW0 @ L01)
-        third_term = np.trace(KW1.T @ KW1 @ L1)
+        # solve (K0 + reg * I) X = K0.T instead of materializing the inverse W0,
+        # so that KW0 = K0 @ W0 without the explicit O(n^3) inversion
+        KW0 = cho_solve(cho0, K0.T).T
+        KW1 = cho_solve(cho1, K1.T).T
+
+        # compute the three terms in Lemma 4.4 as fused contractions; this avoids
+        # materializing the full matrix products only to take their trace
+        first_term = np.einsum("ij,ik,kj->", KW0, KW0, L0, optimize=True)
+        second_term = np.einsum("ij,ik,kj->", KW1, KW0, L01, optimize=True)
+        third_term = np.einsum("ij,ik,kj->", KW1, KW1, L1, optimize=True)
 
         # compute final statistic
         stat = (first_term - 2 * second_term + third_term) / n_samples
         return stat
 
-    def _compute_inverse_kernel(self, K, z) -> Tuple[ArrayLike, ArrayLike]:
-        """Compute W matrices as done in KCD test.
-
-        Parameters
-        ----------
-        K : ArrayLike of shape (n_samples, n_samples)
-            The kernel matrix.
-        z : ArrayLike of shape (n_samples)
-            The indicator variable of 1's and 0's for which samples belong
-            to which group.
-
-        Returns
-        -------
-        W0 : ArrayLike of shape (n_samples_i, n_samples_i)
-            The inverse of the kernel matrix from the first group.
-        W1 : NDArraArrayLike of shape (n_samples_j, n_samples_j)
-            The inverse of the kernel matrix from the second group.
-
-        Notes
-        -----
-        Compute the W matrix for the estimated conditional average in
-        the KCD test :footcite:`Park2021conditional`.
-
-        References
-        ----------
-        .. footbibliography::
-        """
-        # compute kernel matrices
-        first_mask = np.array(1 - z, dtype=bool)
-        second_mask = np.array(z, dtype=bool)
-
-        # TODO: CHECK THAT THIS IS CORRECT
-        K0 = K[np.ix_(first_mask, first_mask)]
-        K1 = K[np.ix_(second_mask, second_mask)]
-
-        # compute regularization factors
-        self._get_regs(K0, K1)
-
-        # compute the number of samples in each
-        n0 = int(np.sum(1 - z))
-        n1 = int(np.sum(z))
-
-        W0 = np.linalg.inv(K0 + self.regs_[0] * np.identity(n0))
-        W1 = np.linalg.inv(K1 + self.regs_[1] * np.identity(n1))
-        return W0, W1
-
     def _get_regs(self, K0: ArrayLike, K1: ArrayLike):
         """Compute regularization factors."""
         if isinstance(self.l2, (int, float)):
@@ -1,5 +1,5 @@
 from math import log, sqrt
-from typing import Optional, Set, Tuple
+from typing import Iterator, List, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
@@ -59,6 +59,48 @@ class FisherZCITest(BaseConditionalIndependenceTest):
         stat, pvalue = fisherz(df, x_var, y_var, z_covariates, self.correlation_matrix)
         return stat, pvalue
 
+    def test_batch(
+        self,
+        df: pd.DataFrame,
+        x_var: Column,
+        y_var: Column,
+        z_list: List[Set[Column]],
+    ) -> Iterator[Tuple[float, float]]:
+        """Test X independent of Y against a batch of conditioning sets.
+
+        The correlation matrix of ``df`` is computed once and shared across
+        all conditioning sets, so each test only pays for the inversion of its
+        small submatrix. Skeleton learners dispatch to this method when many
+        candidate separating sets are evaluated for one edge; results are
+        yielded lazily so a consumer that stops on the first independence
+        never pays for the remaining conditioning sets.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            The dataframe containing the dataset.
+        x_var : Column
+            A column in ``df``.
+        y_var : Column
+            A column in ``df``.
+        z_list : list of set of column
+            The conditioning sets to evaluate.
+
+        Yields
+        ------
+        result : (float, float)
+            The (test statistic, pvalue) pair for each conditioning set, in
+            the order given by ``z_list``.
+        """
+        z_union = set().union(*z_list) if z_list else None
+        self._check_test_input(df, {x_var}, {y_var}, z_union)
+
+        correlation_matrix = self.correlation_matrix
+        if correlation_matrix is None:
+            correlation_matrix = np.corrcoef(df.to_numpy().T)
+        for z in z_list:
+            yield fisherz(df, x_var, y_var, set(z), correlation_matrix)
+
 
 def fisherz(
     data: pd.DataFrame,
@@ -94,10 +136,8 @@ def fisherz(
     p : float
         The p-value of the test.
     """
-    data_arr = data.to_numpy()
-
     if correlation_matrix is None:
-        correlation_matrix = np.corrcoef(data_arr.T)
+        correlation_matrix = np.corrcoef(data.to_numpy().T)
     sample_size = data.shape[0]
     var = list({x, y}.union(sep_set))  # type: ignore
     (var_idx,) = np.in1d(data.columns, var).nonzero()
@@ -249,9 +249,11 @@ class KernelCITest(BaseConditionalIndependenceTest):
         k governs the shape of the pdf, while $\\theta$ governs more how spread out
         the data is.
         """
-        # approximate the mean and the variance
+        # approximate the mean and the variance; uu_prod is symmetric, so
+        # Tr(A @ A) reduces to the sum of its squared entries without
+        # forming the matrix product
         mean_appr = np.trace(uu_prod)
-        var_appr = 2 * np.trace(uu_prod.dot(uu_prod))
+        var_appr = 2 * np.sum(uu_prod**2)
 
         k_appr = mean_appr**2 / var_appr
         theta_appr = var_appr / mean_appr
@@ -270,9 +272,10 @@ class KernelCITest(BaseConditionalIndependenceTest):
             vy = vy[:, wy > np.max(wy) * threshold]
             wy = wy[wy > np.max(wy) * threshold]
 
-        # scale the eigenvectors by their eigenvalues
-        vx = vx.dot(np.diag(np.sqrt(wx)))
-        vy = vy.dot(np.diag(np.sqrt(wy)))
+        # scale the eigenvectors by their eigenvalues; broadcasting scales
+        # the columns without materializing a dense diagonal matrix
+        vx = vx * np.sqrt(wx)
+        vy = vy * np.sqrt(wy)
 
         # compute the product of the scaled eigenvectors
         num_eigx = vx.shape[1]
@@ -2,13 +2,13 @@ from typing import Optional, Tuple
 
 import numpy as np
 from numpy.typing import ArrayLike
-from scipy.linalg import logm
+from scipy.linalg import eigh
 from scipy.optimize import minimize_scalar
 from scipy.stats import gaussian_kde
 from sklearn.metrics import pairwise_distances, pairwise_kernels
 
 
-def von_neumann_divergence(A: ArrayLike, B: ArrayLike) -> float:
+def von_neumann_divergence(A: ArrayLike, B: ArrayLike, eig_tol: Optional[float] = None) -> float:
     """Compute Von Neumann divergence between two PSD matrices.
 
     Parameters
@@ -17,6 +17,10 @@ def von_neumann_divergence(A: ArrayLike, B: ArrayLike) -> float:
         The first PSD matrix.
     B : ArrayLike of shape (n_features, n_features)
         The second PSD matrix.
+    eig_tol : float, optional
+        If given, eigenvalues below this value are discarded from both
+        spectra before evaluating the matrix logarithms, by default None,
+        which keeps the full spectra.
 
     Returns
     -------
@@ -28,8 +32,26 @@ def von_neumann_divergence(A: ArrayLike, B: ArrayLike) -> float:
     The Von Neumann divergence, or what is known as the Bregman divergence in
     :footcite:`Yu2020Bregman` is computed as follows with
     :math:`D(A || B) = Tr(A (log(A) - log(B)) - A + B)`.
+
+    The matrix logarithms are evaluated through the symmetric
+    eigendecompositions of A and B rather than with :func:`scipy.linalg.logm`,
+    since :math:`Tr(A \\log A) = \\sum_i w_i \\log w_i` and
+    :math:`Tr(A \\log B) = \\sum_j \\log(w^B_j) (V_B^T A V_B)_{jj}`, avoiding
+    the general Schur-based algorithm and never materializing a log-matrix.
     """
-    div = np.trace(A.dot(logm(A) - logm(B)) - A + B)
+    subset = None if eig_tol is None else (eig_tol, np.inf)
+    w_a, _ = eigh(A, subset_by_value=subset)
+    w_b, V_b = eigh(B, subset_by_value=subset)
+
+    # Tr(A log(A)) from the spectrum of A, with the convention 0 log(0) = 0
+    pos_a = w_a > 0
+    trace_a_log_a = np.sum(w_a[pos_a] * np.log(w_a[pos_a]))
+
+    # Tr(A log(B)) via the diagonal of V_B^T A V_B
+    diag_b = np.einsum("ij,ij->j", V_b, A @ V_b)
+    trace_a_log_b = np.sum(np.log(w_b) * diag_b)
+
+    div = trace_a_log_a - trace_a_log_b - np.trace(A) + np.trace(B)
     return div
 
 
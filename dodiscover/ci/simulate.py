@@ -2,7 +2,6 @@ from typing import Callable, Optional, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
-from sklearn.utils import check_random_state
 
 
 def nonlinear_additive_gaussian(
@@ -60,33 +59,37 @@ def nonlinear_additive_gaussian(
     ----------
     .. footbibliography::
     """
-    rng = check_random_state(random_state)
-
-    cov = np.eye(dims_z)
-    mu = np.ones(dims_z)
-
-    # generate (n_samples x dims_z) Z variable
-    Z = rng.multivariate_normal(mu, cov, n_samples)
+    # prefer the faster PCG64 Generator; legacy RandomState instances are
+    # still accepted for backwards compatibility
+    if isinstance(random_state, np.random.RandomState):
+        rng = random_state
+    else:
+        rng = np.random.default_rng(random_state)
+
+    # generate (n_samples x dims_z) Z variable with unit mean; with identity
+    # covariance this is just a shifted standard normal draw, which skips the
+    # covariance factorization done by multivariate_normal
+    Z = rng.standard_normal(size=(n_samples, dims_z)) + 1.0
 
     # generate random weighting from Z to X
     # compute the column sums and normalize
-    Azx = rng.rand(dims_z, dims_x)
+    Azx = rng.random(size=(dims_z, dims_x))
     col_sum = np.linalg.norm(Azx, axis=0, keepdims=True)
     Azx = Azx / col_sum
 
     # generate random weighting from Z to Y
-    Azy = rng.rand(dims_z, dims_y)
+    Azy = rng.random(size=(dims_z, dims_y))
     col_sum = np.linalg.norm(Azy, axis=0, keepdims=True)
     Azy = Azy / col_sum
 
     # generate random weighting from X to Y
-    Axy = rng.rand(dims_x, dims_y)
+    Axy = rng.random(size=(dims_x, dims_y))
     col_sum = np.linalg.norm(Axy, axis=0, keepdims=True)
     Axy = Axy / col_sum
 
-    # the sampled multivariate noises
-    X_noise = rng.multivariate_normal(np.zeros(dims_x), np.eye(dims_x), n_samples)
-    Y_noise = rng.multivariate_normal(np.zeros(dims_y), np.eye(dims_y), n_samples)
+    # the sampled isotropic Gaussian noises
+    X_noise = rng.standard_normal(size=(n_samples, dims_x))
+    Y_noise = rng.standard_normal(size=(n_samples, dims_y))
 
     if cause_var is None:
         cause_var = 0
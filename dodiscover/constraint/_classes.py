@@ -7,7 +7,7 @@ import numpy as np
 import pandas as pd
 
 from dodiscover.ci.base import BaseConditionalIndependenceTest
-from dodiscover.constraint.skeleton import ConditioningSetSelection
+from dodiscover.constraint.skeleton import ConditioningSetSelection, _sep_set_entry
 from dodiscover.context import Context
 from dodiscover.typing import Column, SeparatingSet
 
@@ -121,7 +121,7 @@ class BaseConstraintDiscovery:
         self.n_jobs = n_jobs
 
         # initialize the result properties we want to fit
-        self.separating_sets_ = defaultdict(lambda: defaultdict(list))
+        self.separating_sets_ = defaultdict(_sep_set_entry)
         self.graph_ = None
 
         # debugging mode
@@ -129,7 +129,7 @@ class BaseConstraintDiscovery:
 
     def _initialize_sep_sets(self, init_graph: nx.Graph) -> SeparatingSet:
         # keep track of separating sets
-        sep_set: SeparatingSet = defaultdict(lambda: defaultdict(list))
+        sep_set: SeparatingSet = defaultdict(_sep_set_entry)
 
         # since we are not starting from a complete graph, find the separating sets
         for node_i, node_j in itertools.combinations(init_graph.nodes, 2):
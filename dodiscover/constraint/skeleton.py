@@ -1,8 +1,8 @@
 import logging
 from collections import defaultdict
 from copy import deepcopy
-from itertools import chain, combinations
-from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Set, Tuple
+from itertools import combinations
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Set, Tuple
 
 import networkx as nx
 import numpy as np
@@ -22,6 +22,15 @@ from .utils import _find_neighbors_along_path
 logger = logging.getLogger()
 
 
+def _sep_set_entry() -> defaultdict:
+    """Module-level factory for one node's separating-set mapping.
+
+    Using a named function instead of a lambda keeps the nested defaultdict
+    picklable, so fitted learners can cross process boundaries.
+    """
+    return defaultdict(list)
+
+
 def _test_xy_edges(
     parallel_fun: Callable[
         [pd.DataFrame, Callable, Column, Column, Optional[Set[Column]]], Tuple[float, float]
@@ -38,6 +47,7 @@ def _test_xy_edges(
     data: pd.DataFrame,
     context: Context,
     cross_distribution_test: bool = False,
+    batch_fun: Optional[Callable] = None,
 ) -> Dict[str, Any]:
     """Private function used to test edge between X and Y in parallel for candidate separating sets.
 
@@ -62,6 +72,11 @@ def _test_xy_edges(
         A set of variables that are candidates for the conditioning set.
     data : pandas.Dataframe
         The dataset with variables as columns and samples as rows.
+    batch_fun : Callable, optional
+        When the test function exposes a ``test_batch`` hook, the learner's
+        batch evaluation function; all candidate conditioning sets for this
+        edge are then evaluated in a single call, amortizing any shared
+        computation inside the estimator.
 
     Returns
     -------
@@ -80,49 +95,73 @@ def _test_xy_edges(
         size_cond_set=size_cond_set,
     )
 
-    # now iterate through the possible parents
-    for comb_idx, cond_set in enumerate(conditioning_sets):
-        # check the number of combinations of possible parents we have tried
-        # to use as a separating set
-        if max_combinations is not None and comb_idx >= max_combinations:
-            break
-
-        # either process within-distribution, or across distributions
-        this_data = data
-        if cross_distribution_test:
-            # compute conditional independence test
-            # get the sigma-map for this F-node
-            distribution_idx = context.sigma_map[x_var]
-
-            # get the distributions across the two distributions
-            data_i = data[distribution_idx[0]].copy()
-            data_j = data[distribution_idx[1]].copy()
-
-            # name the group column the F-node, so Oracle works as expected
-            data_i[x_var] = 0
-            data_j[x_var] = 1
-            this_data = pd.concat((data_i, data_j), axis=0)
-
-        try:
-            # compute conditional independence test
-            test_stat, pvalue = parallel_fun(
-                this_data, conditional_test_func, x_var, y_var, set(cond_set)
-            )
-        except Exception as e:
-            if "Not enough samples." in str(e):
-                print(e)
-                test_stat = np.inf
-                pvalue = 0.0
+    # either process within-distribution, or across distributions; the stacked
+    # dataset only depends on 'x_var', so it is built once per edge
+    this_data = data
+    if cross_distribution_test:
+        # compute conditional independence test
+        # get the sigma-map for this F-node
+        distribution_idx = context.sigma_map[x_var]
+
+        # get the distributions across the two distributions
+        data_i = data[distribution_idx[0]].copy()
+        data_j = data[distribution_idx[1]].copy()
+
+        # name the group column the F-node, so Oracle works as expected
+        data_i[x_var] = 0
+        data_j[x_var] = 1
+        this_data = pd.concat((data_i, data_j), axis=0)
+
+    if batch_fun is not None:
+        # collect the candidate conditioning sets and hand them to the
+        # estimator in one call; it amortizes shared computation across the
+        # batch while yielding results lazily
+        cond_sets = []
+        for comb_idx, cond_set in enumerate(conditioning_sets):
+            if max_combinations is not None and comb_idx >= max_combinations:
+                break
+            cond_sets.append(cond_set)
+
+        batch_results = batch_fun(
+            this_data, conditional_test_func, x_var, y_var, [set(c) for c in cond_sets]
+        )
+
+        # scan the results in order, mirroring the early-exit of the
+        # sequential loop below; breaking here leaves the remaining
+        # conditioning sets unevaluated
+        for cond_set, (test_stat, pvalue) in zip(cond_sets, batch_results):
+            if pvalue > alpha:
+                break
             else:
-                raise Exception(e)
+                pvalue = max(pvalue, prev_pvalue)
+    else:
+        # now iterate through the possible parents
+        for comb_idx, cond_set in enumerate(conditioning_sets):
+            # check the number of combinations of possible parents we have tried
+            # to use as a separating set
+            if max_combinations is not None and comb_idx >= max_combinations:
+                break
 
-        # if any "independence" is found through inability to reject
-        # the null hypothesis, then we will break the loop comparing X and Y
-        # and say X and Y are conditionally independent given 'cond_set'
-        if pvalue > alpha:
-            break
-        else:
-            pvalue = max(pvalue, prev_pvalue)
+            try:
+                # compute conditional independence test
+                test_stat, pvalue = parallel_fun(
+                    this_data, conditional_test_func, x_var, y_var, set(cond_set)
+                )
+            except Exception as e:
+                if "Not enough samples." in str(e):
+                    print(e)
+                    test_stat = np.inf
+                    pvalue = 0.0
+                else:
+                    raise Exception(e)
+
+            # if any "independence" is found through inability to reject
+            # the null hypothesis, then we will break the loop comparing X and Y
+            # and say X and Y are conditionally independent given 'cond_set'
+            if pvalue > alpha:
+                break
+            else:
+                pvalue = max(pvalue, prev_pvalue)
 
     result: Dict[str, Any] = dict()
     result["x_var"] = x_var
@@ -139,6 +178,8 @@ def candidate_cond_sets(
     x_var: Column,
     y_var: Column,
     keep_sorted: bool = False,
+    level_cache: Optional[Dict] = None,
+    pds_cache: Optional[Dict] = None,
 ):
     """Compute candidate conditioning set using a specific method between two variables.
 
@@ -154,6 +195,16 @@ def candidate_cond_sets(
         The ending node.
     keep_sorted : bool, optional
         Whether or not to keep the conditioning set sorted based on the context, by default False.
+    level_cache : dict, optional
+        A scratch dictionary scoped to one level of the skeleton search, where
+        the adjacency structure is immutable because edge removals are batched
+        at the end of the level. Used to reuse candidate pools that do not
+        depend on ``y_var`` across the edges of one ``x_var``.
+    pds_cache : dict, optional
+        A scratch dictionary scoped to one discovery phase (all conditioning
+        set sizes), over which the PAG state variable is immutable. Used to
+        reuse the possibly d-separating set of each (x, y) pair across
+        levels.
 
     Returns
     -------
@@ -176,45 +227,71 @@ def candidate_cond_sets(
        ending node are possible candidates.
     """
     if condsel_method == ConditioningSetSelection.COMPLETE:
-        possible_variables = set(context.init_graph.nodes)
+        if level_cache is not None:
+            key = ("complete",)
+            if key not in level_cache:
+                level_cache[key] = frozenset(context.init_graph.nodes)
+            possible_variables = set(level_cache[key])
+        else:
+            possible_variables = set(context.init_graph.nodes)
     elif condsel_method == ConditioningSetSelection.NBRS:
-        possible_variables = set(
-            context.init_graph.neighbors(x_var)
-        )  # .union(set(context.init_graph.neighbors(y_var)))
+        if level_cache is not None:
+            key = ("nbrs", x_var)
+            if key not in level_cache:
+                level_cache[key] = frozenset(context.init_graph.neighbors(x_var))
+            possible_variables = set(level_cache[key])
+        else:
+            possible_variables = set(
+                context.init_graph.neighbors(x_var)
+            )  # .union(set(context.init_graph.neighbors(y_var)))
     elif condsel_method == ConditioningSetSelection.NBRS_PATH:
         # constrain adjacency set to ones with a path from x_var to y_var
         possible_variables = _find_neighbors_along_path(context.init_graph, start=x_var, end=y_var)
-    elif condsel_method == ConditioningSetSelection.PDS:
+    elif condsel_method in (ConditioningSetSelection.PDS, ConditioningSetSelection.PDS_PATH):
         import pywhy_graphs as pgraph
 
         pag = context.state_variable("PAG", on_missing="ignore")
         max_path_length = context.state_variable("max_path_length")
+        pds_func = pgraph.pds if condsel_method == ConditioningSetSelection.PDS else pgraph.pds_path
 
         # determine how we want to construct the candidates for separating nodes
-        # perform conditioning independence testing on all combinations
-        possible_variables = pgraph.pds(
-            pag, x_var, y_var, max_path_length=max_path_length  # type: ignore
-        )
-    elif condsel_method == ConditioningSetSelection.PDS_PATH:
-        import pywhy_graphs as pgraph
-
-        pag = context.state_variable("PAG", on_missing="ignore")
-        max_path_length = context.state_variable("max_path_length")
-
-        # determine how we want to construct the candidates for separating nodes
-        # perform conditioning independence testing on all combinations
-        possible_variables = pgraph.pds_path(
-            pag, x_var, y_var, max_path_length=max_path_length  # type: ignore
-        )
+        # perform conditioning independence testing on all combinations.
+        # Both PDS variants are pure functions of the PAG and the path-length
+        # bound, which are frozen state variables for the whole discovery
+        # phase, so the path search for each (x, y) pair is run once and
+        # reused across conditioning-set sizes.
+        if pds_cache is not None:
+            key = (condsel_method, x_var, y_var)
+            if key not in pds_cache:
+                pds_cache[key] = frozenset(
+                    pds_func(pag, x_var, y_var, max_path_length=max_path_length)  # type: ignore
+                )
+            possible_variables = set(pds_cache[key])
+        else:
+            possible_variables = pds_func(
+                pag, x_var, y_var, max_path_length=max_path_length  # type: ignore
+            )
 
     if keep_sorted:
         # Note it is assumed in public API that 'test_stat' is set
-        # inside the adj_graph
-        possible_variables = sorted(
-            possible_variables,
-            key=lambda n: context.init_graph.edges[x_var, n]["test_stat"],  # type: ignore
-            reverse=True,
-        )  # type: ignore
+        # inside the adj_graph. For neighbor pools the ordering only depends
+        # on 'x_var' and the edge attributes, which are frozen within a
+        # level, so the sort is shared across all y variables of one node.
+        if level_cache is not None and condsel_method == ConditioningSetSelection.NBRS:
+            key = ("nbrs_sorted", x_var)
+            if key not in level_cache:
+                level_cache[key] = sorted(
+                    possible_variables,
+                    key=lambda n: context.init_graph.edges[x_var, n]["test_stat"],  # type: ignore
+                    reverse=True,
+                )
+            possible_variables = list(level_cache[key])
+        else:
+            possible_variables = sorted(
+                possible_variables,
+                key=lambda n: context.init_graph.edges[x_var, n]["test_stat"],  # type: ignore
+                reverse=True,
+            )  # type: ignore
 
     if x_var in possible_variables:
         possible_variables.remove(x_var)
@@ -229,7 +306,7 @@ def _iter_conditioning_set(
     x_var: Column,
     y_var: Column,
     size_cond_set: int,
-) -> Iterable[Set]:
+) -> Iterable[Tuple]:
     """Iterate function to generate the conditioning set.
 
     Parameters
@@ -248,17 +325,17 @@ def _iter_conditioning_set(
 
     Yields
     ------
-    Z : set
-        The set of variables for the conditioning set.
+    Z : tuple
+        The variables for the conditioning set. Yielded as a tuple; callers
+        convert to a set only at the test-evaluation boundary, avoiding a set
+        construction per combination.
     """
     exclusion_set = {x_var, y_var}
 
     all_adj_excl_current = [p for p in possible_variables if p not in exclusion_set]
 
     # loop through all possible combinations of the conditioning set size
-    for cond in combinations(all_adj_excl_current, size_cond_set):
-        cond_set = set(cond)
-        yield cond_set
+    yield from combinations(all_adj_excl_current, size_cond_set)
 
 
 class BaseSkeletonLearner:
@@ -276,6 +353,10 @@ class BaseSkeletonLearner:
         The number of iterations of the skeleton learning process that were performed.
         This helps track iteration of algorithms that perform the entire skeleton
         discovery phase multiple times.
+    cache_hits_ : int
+        The number of CI test evaluations answered from the result cache.
+    cache_misses_ : int
+        The number of CI test evaluations that actually ran the test.
     """
 
     #: Callable[[Column, Column, Set[Column]], Tuple[float, float]]
@@ -295,8 +376,9 @@ class BaseSkeletonLearner:
     condsel_method: ConditioningSetSelection
     keep_sorted: bool
 
-    # stopping condition
-    _cont: bool
+    # stopping condition: number of pairs still testable at the current
+    # conditioning set size
+    _n_testable_pairs: int
 
     n_ci_tests: int = 0
 
@@ -315,7 +397,8 @@ class BaseSkeletonLearner:
 
         This function is a "stateful" function of Skeleton learners. It requires
         the ``context_`` object to be preserved as attributes of self. It also keeps
-        track of ``_cont`` private attribute, which helps determine stopping conditions.
+        track of the ``_n_testable_pairs`` private attribute, which helps determine
+        stopping conditions.
 
         Parameters
         ----------
@@ -398,19 +481,32 @@ class BaseSkeletonLearner:
             f"max_cond_set_size: {self.max_cond_set_size_},\n"
         )
 
+        # cache of possibly d-separating sets; the PAG and path-length bound
+        # they are computed from are fixed for this entire discovery phase,
+        # so the per-pair path searches are shared across levels
+        pds_cache: Dict = dict()
+
         # Outer loop: iterate over 'size_cond_set' until stopping criterion is met
         # - 'size_cond_set' > 'max_cond_set_size' or
         # - All (X, Y) pairs have candidate conditioning sets of size < 'size_cond_set'
         while 1:
-            # private attribute '_cont' is used to preserve state and determine a breaking
-            # condition for the constraint-based search algorithm
-            self._cont = False
+            # private attribute '_n_testable_pairs' is used to preserve state and
+            # determine a breaking condition for the constraint-based search
+            # algorithm: the search stops once no pair has a candidate pool
+            # large enough for the current conditioning set size
+            self._n_testable_pairs = 0
 
             # initialize set of edges to remove at the end of every loop
             # track progress of the algorithm for which edges to remove to ensure stability
             # wrt which edges are removed at each process of the algorithm
             remove_edges = set()
 
+            # estimators exposing a 'test_batch' hook evaluate all candidate
+            # conditioning sets of an edge in one call
+            batch_fun = (
+                self.evaluate_edge_batch if hasattr(conditional_test_func, "test_batch") else None
+            )
+
             if self.n_jobs == 1:
                 out = []
                 for x_var, y_var, possible_variables in self._generate_pairs_with_sepset(
@@ -420,6 +516,7 @@ class BaseSkeletonLearner:
                     size_cond_set,
                     skipped_y_nodes=skipped_y_nodes,
                     skipped_z_nodes=skipped_z_nodes,
+                    pds_cache=pds_cache,
                 ):
                     result = _test_xy_edges(
                         self.evaluate_edge,
@@ -433,6 +530,7 @@ class BaseSkeletonLearner:
                         data,
                         context,
                         cross_distribution_test,
+                        batch_fun=batch_fun,
                     )
                     out.append(result)
             else:
@@ -450,6 +548,7 @@ class BaseSkeletonLearner:
                         data,
                         context,
                         cross_distribution_test,
+                        batch_fun=batch_fun,
                     )
                     for x_var, y_var, possible_variables in self._generate_pairs_with_sepset(
                         possible_x_nodes,
@@ -458,6 +557,7 @@ class BaseSkeletonLearner:
                         size_cond_set,
                         skipped_y_nodes=skipped_y_nodes,
                         skipped_z_nodes=skipped_z_nodes,
+                        pds_cache=pds_cache,
                     )
                 )
 
@@ -493,7 +593,7 @@ class BaseSkeletonLearner:
             size_cond_set += 1
 
             # only allow conditioning set sizes up to maximum set number
-            if size_cond_set > self.max_cond_set_size_ or self._cont is False:
+            if size_cond_set > self.max_cond_set_size_ or self._n_testable_pairs == 0:
                 break
 
         self.adj_graph_ = context.init_graph
@@ -507,6 +607,7 @@ class BaseSkeletonLearner:
         size_cond_set: int,
         skipped_y_nodes,
         skipped_z_nodes,
+        pds_cache: Optional[Dict] = None,
     ) -> Generator[Tuple[Column, Column, Set[Column]], None, None]:
         """Generate X, Y and Z pairs for conditional testing.
 
@@ -526,6 +627,9 @@ class BaseSkeletonLearner:
             Allow one to skip Y-nodes that are not of interest in learning edge structure.
         skipped_z_nodes : Set[Column]
             Allow one to skip Z-nodes that are not able to be conditioned on.
+        pds_cache : dict, optional
+            Cache of possibly d-separating sets per (x, y) pair, shared across
+            all conditioning set sizes of one discovery phase.
 
         Yields
         ------
@@ -533,14 +637,45 @@ class BaseSkeletonLearner:
             Generates 'X' variable, 'Y' variable and canddiate 'Z' (i.e. possible separating set
             variables).
         """
-        # TODO: PC algorithm test fails when this is activated...
-        # seen_pairs = set()
+        # Note: (x, y) and (y, x) are deliberately both yielded. The candidate
+        # conditioning pools are x-centric (e.g. the neighbors of x), so the
+        # two orientations search different separating sets; deduplicating
+        # unordered pairs changes the learned skeleton and breaks the PC
+        # algorithm tests.
+
+        # scratch cache for candidate pools; valid for the lifetime of this
+        # generator, i.e. one level of the search where adjacency is immutable
+        level_cache: Dict = dict()
+
+        nbr_methods = (ConditioningSetSelection.NBRS, ConditioningSetSelection.NBRS_PATH)
+
+        # the prescreen heuristic only applies once a level of tests has run,
+        # so that every surviving edge carries a real maximum pvalue rather
+        # than the initialization sentinel
+        prescreen_factor = getattr(self, "prescreen_factor", None)
+        prescreen = prescreen_factor is not None and size_cond_set > self.min_cond_set_size_
 
         # loop through every node that we want to test
         for x_var in possible_x_nodes:
-            possible_adjacencies = set(context.init_graph.neighbors(x_var))
+            # the adjacency view supports len() and iteration without copying;
+            # iterating it directly is safe because edge removal is batched
+            # until after the generator is exhausted
+            possible_adjacencies = context.init_graph.adj[x_var]
             logger.info(f"Considering node {x_var}...\n\n")
 
+            # cheap upper bounds on the candidate-pool size let us skip the
+            # expensive per-pair candidate computation (e.g. the path search
+            # of 'neighbors_path') for nodes that cannot be tested at this
+            # level: neighbor-based pools are subsets of Adj(x) - {y}, and the
+            # complete pool is V - {x, y}. Note this does not count towards
+            # '_n_testable_pairs', matching the pool-size check below.
+            if condsel_method in nbr_methods:
+                if len(possible_adjacencies) - 1 < size_cond_set:
+                    continue
+            elif condsel_method == ConditioningSetSelection.COMPLETE:
+                if len(context.init_graph.nodes) - 2 < size_cond_set:
+                    continue
+
             for y_var in possible_adjacencies:
                 # a node cannot be a parent to itself in DAGs
                 if y_var == x_var:
@@ -549,21 +684,38 @@ class BaseSkeletonLearner:
                 if y_var in skipped_y_nodes:
                     continue
 
-                # prevent yielding the same edge pair twice
-                # if (x_var, y_var) in seen_pairs or (y_var, x_var) in seen_pairs:
-                #     continue
-
                 if (x_var, y_var) in context.included_edges.edges:
                     continue
 
+                # heuristically skip edges that have looked strongly dependent
+                # in every test so far; these are unlikely to become
+                # independent at larger conditioning sets
+                if (
+                    prescreen
+                    and context.init_graph.edges[x_var, y_var]["pvalue"] >= 0
+                    and context.init_graph.edges[x_var, y_var]["pvalue"] * prescreen_factor
+                    < self.alpha
+                ):
+                    continue
+
                 # compute the possible variables used in the conditioning set
                 possible_variables = candidate_cond_sets(
-                    condsel_method, context, x_var, y_var, keep_sorted=self.keep_sorted
+                    condsel_method,
+                    context,
+                    x_var,
+                    y_var,
+                    keep_sorted=self.keep_sorted,
+                    level_cache=level_cache,
+                    pds_cache=pds_cache,
                 )
 
-                # remove nodes that are not allowed to be conditioned on
+                # remove nodes that are not allowed to be conditioned on,
+                # preserving candidate order when 'keep_sorted' produced a list
                 # XXX: if used, this may result in improper graphs learned even in oracle setting
-                possible_variables = possible_variables.difference(skipped_z_nodes)
+                if isinstance(possible_variables, list):
+                    possible_variables = [p for p in possible_variables if p not in skipped_z_nodes]
+                else:
+                    possible_variables = possible_variables.difference(skipped_z_nodes)
 
                 logger.debug(
                     f"Adj({x_var}) without {y_var} with size={len(possible_adjacencies) - 1} "
@@ -580,9 +732,8 @@ class BaseSkeletonLearner:
                     )
                     continue
                 else:
-                    self._cont = True
+                    self._n_testable_pairs += 1
 
-                # seen_pairs.add((x_var, y_var))
                 yield x_var, y_var, possible_variables
 
     def _postprocess_ci_test(
@@ -615,10 +766,13 @@ class BaseSkeletonLearner:
         """
         # keep track of the smallest test statistic, meaning the highest pvalue
         # meaning the "most" independent. keep track of the maximum pvalue as well
-        if pvalue > context.init_graph.edges[x_var, y_var]["pvalue"]:  # type: ignore
-            context.init_graph.edges[x_var, y_var]["pvalue"] = pvalue  # type: ignore
-        if test_stat < context.init_graph.edges[x_var, y_var]["test_stat"]:  # type: ignore
-            context.init_graph.edges[x_var, y_var]["test_stat"] = test_stat  # type: ignore
+        # resolve the edge's attribute dictionary once; it is shared for both
+        # directions, so the updates below cover (y_var, x_var) too
+        edge_attrs = context.init_graph.edges[x_var, y_var]  # type: ignore
+        if pvalue > edge_attrs["pvalue"]:
+            edge_attrs["pvalue"] = pvalue
+        if test_stat < edge_attrs["test_stat"]:
+            edge_attrs["test_stat"] = test_stat
 
     def _summarize_xy_comparison(
         self, x_var: Column, y_var: Column, removed_edge: bool, pvalue: float
@@ -666,10 +820,88 @@ class BaseSkeletonLearner:
         """
         if Z is None:
             Z = set()
+
+        # the same (X, Y, Z) triple can be revisited across conditioning-set
+        # sizes and discovery stages; a given test function is deterministic in
+        # its inputs, so repeat queries are answered from a cache instead of
+        # re-running the test
+        if not hasattr(self, "_ci_cache"):
+            self._ci_cache: Dict = dict()
+            self.cache_hits_ = 0
+            self.cache_misses_ = 0
+
+        cache_key = (id(conditional_test_func), frozenset({X, Y}), frozenset(Z))
+        if cache_key in self._ci_cache:
+            self.cache_hits_ += 1
+            return self._ci_cache[cache_key]
+
         test_stat, pvalue = conditional_test_func.test(data, set({X}), set({Y}), Z)
+        self._ci_cache[cache_key] = (test_stat, pvalue)
+        self.cache_misses_ += 1
         self.n_ci_tests += 1
         return test_stat, pvalue
 
+    def evaluate_edge_batch(
+        self,
+        data: pd.DataFrame,
+        conditional_test_func,
+        X: Column,
+        Y: Column,
+        Z_list: List[Set[Column]],
+    ) -> Iterator[Tuple[float, float]]:
+        """Test an edge against a batch of conditioning sets at once.
+
+        Dispatches to the test function's optional ``test_batch`` hook, which
+        can amortize computation shared across the conditioning sets (for
+        example a correlation matrix for Fisher-Z). Results are yielded
+        lazily and answered from the CI cache where possible, so a consumer
+        that stops on the first independence neither runs nor counts the
+        remaining tests.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The dataset.
+        X : column
+            A column in ``data``.
+        Y : column
+            A column in ``data``.
+        Z_list : list of set
+            The conditioning sets to evaluate.
+
+        Yields
+        ------
+        result : (float, float)
+            The (test statistic, pvalue) pair per conditioning set, in the
+            order given by ``Z_list``.
+        """
+        if not hasattr(self, "_ci_cache"):
+            self._ci_cache = dict()
+            self.cache_hits_ = 0
+            self.cache_misses_ = 0
+
+        # only the conditioning sets missing from the cache are handed to the
+        # estimator; its results are consumed lazily, so conditioning sets
+        # past an early exit by the consumer are never evaluated
+        uncached = [
+            Z
+            for Z in Z_list
+            if (id(conditional_test_func), frozenset({X, Y}), frozenset(Z)) not in self._ci_cache
+        ]
+        batch_results = iter(conditional_test_func.test_batch(data, X, Y, uncached))
+
+        for Z in Z_list:
+            cache_key = (id(conditional_test_func), frozenset({X, Y}), frozenset(Z))
+            if cache_key in self._ci_cache:
+                self.cache_hits_ += 1
+                yield self._ci_cache[cache_key]
+            else:
+                result = next(batch_results)
+                self._ci_cache[cache_key] = result
+                self.cache_misses_ += 1
+                self.n_ci_tests += 1
+                yield result
+
 
 class LearnSkeleton(BaseSkeletonLearner):
     """Learn a skeleton graph from observational data without latent confounding.
@@ -711,6 +943,15 @@ class LearnSkeleton(BaseSkeletonLearner):
         by its dependencies from strongest to weakest (i.e. largest CI test statistic value
         to lowest). This can be used in conjunction with ``max_combinations`` parameter
         to only test the "strongest" dependences.
+    prescreen_factor : float, optional
+        If set, edges whose largest pvalue seen so far is below
+        ``alpha / prescreen_factor`` are skipped at conditioning set sizes
+        beyond ``min_cond_set_size``. Such edges have looked strongly
+        dependent in every test run so far, and are heuristically unlikely
+        to become independent given larger conditioning sets. This is a
+        trade-off that can drastically reduce the number of CI tests on
+        datasets with many variables, at the cost of possibly missing some
+        edge removals. By default None, meaning all edges are tested.
     n_jobs : int, optional
         Number of CPUs to use, by default None.
 
@@ -771,6 +1012,7 @@ class LearnSkeleton(BaseSkeletonLearner):
         max_combinations: Optional[int] = None,
         condsel_method: ConditioningSetSelection = ConditioningSetSelection.NBRS,
         keep_sorted: bool = False,
+        prescreen_factor: Optional[float] = None,
         n_jobs: Optional[int] = None,
     ) -> None:
         self.ci_estimator = ci_estimator
@@ -787,6 +1029,9 @@ class LearnSkeleton(BaseSkeletonLearner):
         # for tracking strength of dependencies
         self.keep_sorted = keep_sorted
 
+        # heuristic pre-screening of strongly dependent edges
+        self.prescreen_factor = prescreen_factor
+
         # debugging mode
         self.n_ci_tests = 0
         self.n_iters_ = 0
@@ -808,9 +1053,14 @@ class LearnSkeleton(BaseSkeletonLearner):
                 f"{self.condsel_method}."
             )
 
+        # reset the CI result cache, since a new fit may use different data
+        self._ci_cache: Dict = dict()
+        self.cache_hits_ = 0
+        self.cache_misses_ = 0
+
         if self.sep_set is None and not hasattr(self, "sep_set_"):
             # keep track of separating sets
-            self.sep_set_ = defaultdict(lambda: defaultdict(list))
+            self.sep_set_ = defaultdict(_sep_set_entry)
         elif not hasattr(self, "sep_set_"):
             self.sep_set_ = self.sep_set  # type: ignore
 
@@ -830,10 +1080,10 @@ class LearnSkeleton(BaseSkeletonLearner):
 
         # allow us to query the iteration stage of the causal discovery algorithm
         # allowing us to run multiple iterations of the skeleton discovery
-        edge_attrs = set(
-            chain.from_iterable(d.keys() for *_, d in context.init_graph.edges(data=True))
-        )
-        if self.n_iters_ == 0 and "test_stat" in edge_attrs or "pvalue" in edge_attrs:
+        if any(
+            ("test_stat" in d and self.n_iters_ == 0) or "pvalue" in d
+            for *_, d in context.init_graph.edges(data=True)
+        ):
             raise RuntimeError(
                 "Running skeleton discovery with adjacency graph "
                 "with 'test_stat' or 'pvalue' is not supported yet."
@@ -1062,10 +1312,10 @@ class LearnSemiMarkovianSkeleton(LearnSkeleton):
         # Note: this needs to get called again
         # allow us to query the iteration stage of the causal discovery algorithm
         # allowing us to run multiple iterations of the skeleton discovery
-        edge_attrs = set(
-            chain.from_iterable(d.keys() for *_, d in context.init_graph.edges(data=True))
-        )
-        if self.n_iters_ == 0 and "test_stat" in edge_attrs or "pvalue" in edge_attrs:
+        if any(
+            ("test_stat" in d and self.n_iters_ == 0) or "pvalue" in d
+            for *_, d in context.init_graph.edges(data=True)
+        ):
             raise RuntimeError(
                 "Running skeleton discovery with adjacency graph "
                 "with 'test_stat' or 'pvalue' is not supported yet."
@@ -72,27 +72,10 @@ def _find_neighbors_along_path(G: nx.Graph, start, end) -> Set:
         The set of neighbors that are also along a path towards
         the 'end' node.
     """
-    nbrs = set()
-
-    # query all neighbors of X and then only add nodes that are in a valid path
-    # to end
-    for node in G.neighbors(start):
-        if not G.has_edge(start, node):
-            raise RuntimeError(f"{start} and {node} are not connected, but they are assumed to be.")
-
-        # if we queried the edge we are testing, then pick that one
-        if node == end:
-            continue
-
-        # find a path from start node to end
-        paths = nx.all_simple_paths(G, source=node, target=end)
-        for path in paths:
-            # the trivial path which indicates that 'node' is only connected to
-            # 'end' through 'start'
-            if path == (node, start, end):
-                continue
-            else:
-                # found a single path
-                nbrs.add(node)
-                break
-    return nbrs
+    # a neighbor of 'start' is along a path to 'end' exactly when it lies in
+    # the connected component of 'end'; one reachability scan answers this for
+    # all neighbors at once, instead of enumerating simple paths per neighbor
+    if end not in G:
+        return set()
+    reachable = nx.node_connected_component(G, end)
+    return {node for node in G.neighbors(start) if node != end and node in reachable}
@@ -1,7 +1,7 @@
 import types
 from copy import copy
 from itertools import combinations
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from warnings import warn
 
 import networkx as nx
@@ -26,15 +26,25 @@ class ContextBuilder:
     `dodiscover.make_context` to build a Context data structure.
     """
 
-    _init_graph: Optional[Graph] = None
-    _included_edges: Optional[NetworkxGraph] = None
-    _excluded_edges: Optional[NetworkxGraph] = None
-    _observed_variables: Optional[Set[Column]] = None
-    _latent_variables: Optional[Set[Column]] = None
-    _state_variables: Dict[str, Any] = dict()
+    __slots__ = (
+        "_init_graph",
+        "_included_edges",
+        "_excluded_edges",
+        "_observed_variables",
+        "_latent_variables",
+        "_state_variables",
+    )
+
+    _init_graph: Optional[Graph]
+    _included_edges: Optional[NetworkxGraph]
+    _excluded_edges: Optional[NetworkxGraph]
+    _observed_variables: Optional[Set[Column]]
+    _latent_variables: Optional[Set[Column]]
+    _state_variables: Dict[str, Any]
 
     def __init__(self) -> None:
-        # perform an error-check on subclass definitions of ContextBuilder
+        # perform an error-check on subclass definitions of ContextBuilder;
+        # for slotted classes this walks the slot descriptors of the class
         for attribute, value in self.__class__.__dict__.items():
             if isinstance(value, CALLABLES) or isinstance(value, property):
                 continue
@@ -49,6 +59,16 @@ class ContextBuilder:
                     f"corresponding function name '<name>'."
                 )
 
+        # per-instance defaults; in particular the state-variable dict must
+        # not live on the class, where it would be shared (and mutated)
+        # across every builder instance
+        self._init_graph = None
+        self._included_edges = None
+        self._excluded_edges = None
+        self._observed_variables = None
+        self._latent_variables = None
+        self._state_variables = dict()
+
     def init_graph(self, graph: Graph) -> "ContextBuilder":
         """Set the partial graph to start with.
 
@@ -250,9 +270,13 @@ class ContextBuilder:
         if self._observed_variables is None:
             raise ValueError("Could not infer variables from data or given arguments.")
 
-        empty_graph = self._empty_graph_func(self._observed_variables)
+        # materialize the node list once; each graph construction below
+        # re-iterates its argument, so handing them the same list avoids
+        # walking the variable set three times
+        node_list = list(self._observed_variables)
+        empty_graph = self._empty_graph_func(node_list)
         return Context(
-            init_graph=self._interpolate_graph(self._observed_variables),
+            init_graph=self._interpolate_graph(node_list),
             included_edges=self._included_edges or empty_graph(),
             excluded_edges=self._excluded_edges or empty_graph(),
             observed_variables=self._observed_variables,
@@ -266,26 +290,28 @@ class ContextBuilder:
         observed: Optional[Set[Column]] = None,
         latents: Optional[Set[Column]] = None,
     ) -> Tuple[Set[Column], Set[Column]]:
-        # initialize and parse the set of variables, latents and others
+        # initialize and parse the set of variables, latents and others;
+        # each input collection is converted to a set exactly once
         columns = set(data.columns)
+        observed = set(observed) if observed is not None else None
+        latents = set(latents) if latents is not None else None
+
         if observed is not None and latents is not None:
-            if columns - set(observed) != set(latents):
+            if columns - observed != latents:
                 raise ValueError(
                     "If observed and latents are both set, then they must "
                     "include all columns in data."
                 )
         elif observed is None and latents is not None:
-            observed = columns - set(latents)
+            observed = columns - latents
         elif latents is None and observed is not None:
-            latents = columns - set(observed)
-        elif observed is None and latents is None:
+            latents = columns - observed
+        else:
             # when neither observed, nor latents is set, it is assumed
             # that the data is all "not latent"
             observed = columns
             latents = set()
 
-        observed = set(cast(Set[Column], observed))
-        latents = set(cast(Set[Column], latents))
         return (observed, latents)
 
     def _interpolate_graph(self, graph_variables) -> nx.Graph:
@@ -327,9 +353,21 @@ class InterventionalContextBuilder(ContextBuilder):
     to build the :class:`~.context.Context` object here.
     """
 
-    _intervention_targets: Optional[List[Tuple[Column]]] = None
-    _num_distributions: Optional[int] = None
-    _obs_distribution: bool = True
+    __slots__ = (
+        "_intervention_targets",
+        "_num_distributions",
+        "_obs_distribution",
+    )
+
+    _intervention_targets: Optional[List[Tuple[Column]]]
+    _num_distributions: Optional[int]
+    _obs_distribution: bool
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._intervention_targets = None
+        self._num_distributions = None
+        self._obs_distribution = True
 
     def obs_distribution(self, has_obs_distrib: bool):
         """Whether or not we have access to the observational distribution.
@@ -412,11 +450,11 @@ class InterventionalContextBuilder(ContextBuilder):
         f_nodes, sigma_map, symmetric_diff_map = self._create_augmented_nodes(
             intervention_targets, num_distributions
         )
-        graph_variables = set(self._observed_variables).union(set(f_nodes))
+        node_list = list(self._observed_variables) + list(f_nodes)
 
-        empty_graph = self._empty_graph_func(graph_variables)
+        empty_graph = self._empty_graph_func(node_list)
         return Context(
-            init_graph=self._interpolate_graph(graph_variables),
+            init_graph=self._interpolate_graph(node_list),
             included_edges=self._included_edges or empty_graph(),
             excluded_edges=self._excluded_edges or empty_graph(),
             observed_variables=self._observed_variables,
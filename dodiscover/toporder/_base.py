@@ -9,6 +9,7 @@ import pandas as pd
 from numpy.typing import NDArray
 from pygam import LinearGAM, s
 from pygam.terms import Term, TermList
+from scipy.linalg import cho_factor, cho_solve
 from sklearn.metrics.pairwise import rbf_kernel
 
 from dodiscover.context import Context
@@ -46,14 +47,20 @@ class SteinMixin:
         ----------
         .. footbibliography::
         """
-        _, d = X.shape
+        n, d = X.shape
         s = kernel_width(X)
         K = self._evaluate_kernel(X, s=s)
         nablaK = self._evaluate_nablaK(K, X, s)
         G = self.score(X, eta_G, K, nablaK)
 
+        # the regularized kernel system and the pairwise sample differences
+        # are identical for every column, so factorize and compute them once
+        # rather than once per column
+        choK = cho_factor(K + eta_H * np.eye(n), lower=True)
+        X_diff = self._X_diff(X)
+
         # Compute the Hessian by column stacked together
-        H = np.stack([self._hessian_col(X, G, col, eta_H, K, s) for col in range(d)], axis=1)
+        H = np.stack([self._hessian_col(X_diff, G, col, choK, K, s) for col in range(d)], axis=1)
         return H
 
     def score(
@@ -96,24 +103,27 @@ class SteinMixin:
             K = self._evaluate_kernel(X, s)
             nablaK = self._evaluate_nablaK(K, X, s)
 
-        G = np.matmul(np.linalg.inv(K + eta_G * np.eye(n)), nablaK)
+        # (K + eta_G * I) is symmetric positive definite, so the ridge system
+        # is solved through its Cholesky factor instead of an explicit inverse
+        G = cho_solve(cho_factor(K + eta_G * np.eye(n), lower=True), nablaK)
         return G
 
     def _hessian_col(
-        self, X: NDArray, G: NDArray, c: int, eta: float, K: NDArray, s: float
+        self, X_diff: NDArray, G: NDArray, c: int, choK: Tuple, K: NDArray, s: float
     ) -> NDArray:
         """Stein estimator of a column of the Hessian of log p(x)
 
         Parameters
         ----------
-        X : np.ndarray of shape (n_samples, n_nodes)
-            Matrix of the data
+        X_diff : np.ndarray of shape (n_samples, n_samples, n_nodes)
+            Matrix of the difference between samples of the data.
         G : np.ndarray
             estimator of the score function.
         c : int
             index of the column of interest.
-        eta: float
-            regularization parameter for ridge regression in Stein hessian estimator
+        choK : tuple
+            Cholesky factorization of the regularized Gaussian kernel as
+            returned by :func:`scipy.linalg.cho_factor`, shared by all columns.
         K : np.ndarray of shape (n_samples, n_samples)
             Gaussian kernel evaluated at X.
         s : float
@@ -124,14 +134,11 @@ class SteinMixin:
         H_col : np.ndarray
             Stein estimator of the c-th column of the Hessian of log p(x)
         """
-        X_diff = self._X_diff(X)
-        n, _, _ = X_diff.shape
-
         # Stein estimate
         Gv = np.einsum("i,ij->ij", G[:, c], G)
         nabla2vK = np.einsum("ik,ikj,ik->ij", X_diff[:, :, c], X_diff, K) / s**4
         nabla2vK[:, c] -= np.einsum("ik->i", K) / s**2
-        H_col = -Gv + np.matmul(np.linalg.inv(K + eta * np.eye(n)), nabla2vK)
+        H_col = -Gv + cho_solve(choK, nabla2vK)
         return H_col
 
     def hessian_diagonal(self, X: NDArray, eta_G: float, eta_H: float) -> NDArray:
@@ -162,7 +169,7 @@ class SteinMixin:
         # Hessian compute
         X_diff = self._X_diff(X)
         nabla2K = np.einsum("kij,ik->kj", -1 / s**2 + X_diff**2 / s**4, K)
-        return -(G**2) + np.matmul(np.linalg.inv(K + eta_H * np.eye(n)), nabla2K)
+        return -(G**2) + cho_solve(cho_factor(K + eta_H * np.eye(n), lower=True), nabla2K)
 
     def _evaluate_kernel(self, X: NDArray, s: float) -> Tuple[NDArray, Union[NDArray, None]]:
         """
@@ -282,9 +289,12 @@ class CAMPruning:
         _, d = X.shape
         A = np.zeros((d, d))
         order = full_adj_to_order(A_dense)
+        # position of each node in the ordering, computed once instead of an
+        # O(d) order.index lookup per node
+        order_pos = {node: i for i, node in enumerate(order)}
         for c in range(d):
             pot_parents = []
-            for p in order[: order.index(c)]:
+            for p in order[: order_pos[c]]:
                 if ((not G_excluded.has_edge(p, c)) and A_dense[p, c] == 1) or G_included.has_edge(
                     p, c
                 ):
@@ -672,12 +682,10 @@ class BaseTopOrder(CAMPruning, TopOrderInterface):
         adj = nx.to_numpy_array(self._get_included_edges_graph())
         d, _ = adj.shape
         descendants: Dict = {i: list() for i in range(d)}
-        for row in range(d):
-            for col in range(d):
-                if adj[row, col] == 1:
-                    row_descendants = descendants[row]
-                    row_descendants.append(col)
-                    descendants[row] = row_descendants
+        # one vectorized scan of the adjacency matrix instead of a Python
+        # loop over all d^2 entries
+        for row, col in np.argwhere(adj == 1):
+            descendants[int(row)].append(int(col))
         return descendants
 
     def _postprocess_output(self, graph):
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 import numpy as np
 from numpy.typing import NDArray
@@ -50,6 +50,13 @@ class DAS(SCORE):
         Maximum number of parents allowed for a single node, default is 20.
         Given that CAM pruning is inefficient for > ~20 nodes, larger values are not advised.
         The value of max_parents should be decrease under the assumption of sparse graphs.
+    prune_dtype : type, optional
+        Floating point dtype of the Hessian tensor consumed by the preliminary
+        pruning step, default is ``np.float32``. The step only ranks magnitudes
+        and runs Welch's t-tests, which do not need float64 dynamic range, and
+        streaming the (n_samples, n_nodes, n_nodes) tensor at half the width
+        halves its memory traffic. Pass ``np.float64`` to keep full precision.
+        The final CAM pruning is unaffected and always runs in float64.
 
     References
     ----------
@@ -76,6 +83,7 @@ class DAS(SCORE):
         splines_degree: int = 3,
         min_parents: int = 5,
         max_parents: int = 20,
+        prune_dtype: type = np.float32,
     ):
         super().__init__(
             eta_G, eta_H, alpha, prune, n_splines, splines_degree, estimate_variance=True, pns=False
@@ -83,6 +91,7 @@ class DAS(SCORE):
         self.min_parents = min_parents
         self.max_parents = max_parents
         self.das_cutoff = alpha if das_cutoff is None else das_cutoff
+        self.prune_dtype = prune_dtype
 
     def _prune(self, X: NDArray, A_dense: NDArray) -> NDArray:
         """
@@ -102,46 +111,97 @@ class DAS(SCORE):
         """
         _, d = X.shape
         order = full_adj_to_order(A_dense)
-        max_parents = self.max_parents + 1  # +1 to account for A[l, l] = 1
-        remaining_nodes = list(range(d))
+        # nodes without an assigned order, tracked as a boolean mask; list
+        # index/pop bookkeeping would cost O(d) scans and shifts per leaf
+        alive = np.ones(d, dtype=bool)
         A_das = np.zeros((d, d))
 
         hess = self.hessian(X, eta_G=self.eta_G, eta_H=self.eta_H)
+        # the selection step is memory bound; narrowing the tensor (float32
+        # by default) halves the bandwidth it streams
+        hess = hess.astype(self.prune_dtype, copy=False)
+        # transpose so each per-leaf slab hess_T[leaf] is one contiguous
+        # (n_samples, n_nodes) block; the selection step then gathers columns
+        # from it once instead of fancy-indexing the full tensor twice
+        hess_T = np.ascontiguousarray(hess.transpose(1, 0, 2))
         for i in range(d - 1):
             leaf = order[::-1][i]
-            hess_l = hess[:, leaf, :][:, remaining_nodes]
-            hess_m = np.abs(np.median(hess_l * self.var[leaf], axis=0))
-            max_parents = min(max_parents, len(remaining_nodes))
-
-            # Find index of the reference for the hypothesis testing
-            topk_indices = np.argsort(hess_m)[::-1][:max_parents]
-            topk_values = hess_m[topk_indices]  # largest
-            argmin = topk_indices[np.argmin(topk_values)]
-
-            # Edges selection step
-            parents = []
-            hess_l = np.abs(hess_l)
-            l_index = remaining_nodes.index(
-                leaf
-            )  # leaf index in the remaining nodes (from 0 to len(remaining_nodes)-1)
-            for j in range(max_parents):
-                node = topk_indices[j]
-                if node != l_index:  # enforce diagonal elements = 0
-                    if j < self.min_parents:  # do not filter minimum number of parents
-                        parents.append(remaining_nodes[node])
-                    else:  # filter potential parents with hp testing
-                        # Use hess_l[:, argmin] as sample from a zero mean population
-                        # (implicit assumption: argmin corresponds to zero mean hessian entry)
-                        _, pval = ttest_ind(
-                            hess_l[:, node],
-                            hess_l[:, argmin],
-                            alternative="greater",
-                            equal_var=False,
-                        )
-                        if pval < self.das_cutoff:
-                            parents.append(remaining_nodes[node])
-
+            remaining_nodes = np.flatnonzero(alive)
+            # leaf index in the remaining nodes (from 0 to len(remaining_nodes)-1);
+            # 'remaining_nodes' is sorted, so a binary search suffices
+            l_index = int(np.searchsorted(remaining_nodes, leaf))
+            parents = self._leaf_parents(hess_T[leaf], leaf, l_index, remaining_nodes)
             A_das[parents, leaf] = 1
-            remaining_nodes.pop(l_index)
+            alive[leaf] = False
 
         return super()._prune(X, A_das)
+
+    def _leaf_parents(
+        self, hess_leaf: NDArray, leaf: int, l_index: int, remaining_nodes: NDArray
+    ) -> List[int]:
+        """Select the parents of `leaf` by inspection of its Hessian entries.
+
+        The candidate parents are the nodes with the largest magnitude of the
+        off diagonal Hessian entries of the leaf. Beyond the ``min_parents``
+        strongest candidates, each is kept only if hypothesis testing rejects a
+        zero mean Hessian entry.
+
+        Parameters
+        ----------
+        hess_leaf : np.ndarray of shape (n_samples, n_nodes)
+            Contiguous slab of the Stein Hessian estimator holding the
+            entries of the leaf's row for every sample.
+        leaf : int
+            The current leaf node.
+        l_index : int
+            Index of the leaf in the list of the remaining nodes.
+        remaining_nodes : np.ndarray of shape (n_remaining,)
+            Sorted indices of the nodes without a position in the
+            topological ordering.
+
+        Returns
+        -------
+        parents : List[int]
+            The selected parents of the leaf node.
+        """
+        hess_l = hess_leaf[:, remaining_nodes]
+        # scalar self.var[leaf] is factored out of the median, sparing the
+        # elementwise multiply over the whole (n_samples, n_remaining) slab
+        hess_m = np.abs(self.var[leaf]) * np.abs(np.median(hess_l, axis=0))
+        max_parents = min(self.max_parents + 1, len(remaining_nodes))  # +1: A[l, l] = 1
+
+        # Find index of the reference for the hypothesis testing.
+        # argpartition selects the top 'max_parents' entries in linear time;
+        # only those few are then sorted in descending order
+        top = np.argpartition(hess_m, -max_parents)[-max_parents:]
+        topk_indices = top[np.argsort(hess_m[top])[::-1]]
+        topk_values = hess_m[topk_indices]  # largest
+        argmin = topk_indices[np.argmin(topk_values)]
+
+        # Edges selection step
+        hess_l = np.abs(hess_l)
+
+        # do not filter minimum number of parents, enforce diagonal elements = 0
+        parents = [
+            remaining_nodes[node] for node in topk_indices[: self.min_parents] if node != l_index
+        ]
+
+        # filter the other potential parents with hp testing.
+        # Use hess_l[:, argmin] as sample from a zero mean population
+        # (implicit assumption: argmin corresponds to zero mean hessian entry).
+        # All candidates are tested against the reference column in a single
+        # vectorized Welch's t-test instead of one SciPy call per candidate
+        test_indices = np.array(
+            [node for node in topk_indices[self.min_parents :] if node != l_index], dtype=int
+        )
+        if len(test_indices) > 0:
+            _, pvals = ttest_ind(
+                hess_l[:, test_indices],
+                hess_l[:, argmin, None],
+                alternative="greater",
+                equal_var=False,
+            )
+            for node, pval in zip(test_indices, pvals):
+                if pval < self.das_cutoff:
+                    parents.append(remaining_nodes[node])
+        return parents
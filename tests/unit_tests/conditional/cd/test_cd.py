@@ -133,3 +133,37 @@ def test_cd_simulation(cd_func, df, env_type, cd_kwargs):
         assert pvalue < alpha, f"Fails with {pvalue} not less than {alpha}"
         _, pvalue = cd_estimator.test(df, y_vars={"z"}, group_col={group_col}, x_vars={"x1"})
         assert pvalue < alpha, f"Fails with {pvalue} not less than {alpha}"
+
+
+def test_cd_parallel_null_matches_sequential():
+    """Test the parallel null-distribution path, including memmap cleanup.
+
+    With ``n_jobs=2`` the base ``compute_null`` hands the workers read-only
+    memmaps of the kernels from a temporary directory; the maps must be
+    closed before the directory is removed (Windows cannot delete files
+    that are still mapped) and the result must match the sequential path.
+    """
+    df = single_env_scm(n_samples=120)
+
+    results = dict()
+    for n_jobs in (1, 2):
+        cd_estimator = KernelCDTest(null_reps=20, n_jobs=n_jobs, random_state=seed)
+        results[n_jobs] = cd_estimator.test(df, y_vars={"y"}, group_col={"group"}, x_vars={"x"})
+
+    assert results[2] == pytest.approx(results[1])
+
+
+@pytest.mark.parametrize("cd_func", [BregmanCDTest, KernelCDTest])
+def test_cd_reduced_precision_dtype(cd_func):
+    """Test that the opt-in float32 dtype closely tracks the float64 default."""
+    df = single_env_scm(n_samples=120)
+
+    results = dict()
+    for dtype in (np.float64, np.float32):
+        cd_estimator = cd_func(dtype=dtype, null_reps=20, random_state=seed)
+        results[dtype] = cd_estimator.test(df, y_vars={"y"}, group_col={"group"}, x_vars={"x"})
+
+    stat64, pvalue64 = results[np.float64]
+    stat32, pvalue32 = results[np.float32]
+    assert stat32 == pytest.approx(stat64, rel=1e-3)
+    assert pvalue32 == pvalue64
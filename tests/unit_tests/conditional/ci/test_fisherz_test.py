@@ -33,3 +33,26 @@ def test_fisher_z():
     assert pvalue < 0.05
     _, pvalue = ci_estimator.test(df, {"x"}, {"z"}, {"y"})
     assert pvalue > 0.05
+
+
+def test_fisher_z_batch():
+    """Test that the batch hook matches per-set tests and is lazy."""
+    rng = np.random.RandomState(seed)
+    X = rng.randn(300, 1)
+    X1 = rng.randn(300, 1)
+    Y = X + X1 + 0.5 * rng.randn(300, 1)
+    Z = Y + 0.1 * rng.randn(300, 1)
+    df = pd.DataFrame(np.hstack((X, X1, Y, Z)), columns=["x", "x1", "y", "z"])
+
+    ci_estimator = FisherZCITest()
+    z_list = [set(), {"y"}, {"z"}, {"y", "z"}]
+
+    # the batch results are yielded lazily, so consumers can stop early
+    # without evaluating the remaining conditioning sets
+    batch_results = ci_estimator.test_batch(df, "x", "x1", z_list)
+    assert iter(batch_results) is batch_results
+
+    for z, (batch_stat, batch_pvalue) in zip(z_list, batch_results):
+        stat, pvalue = ci_estimator.test(df, {"x"}, {"x1"}, z)
+        assert batch_stat == stat
+        assert batch_pvalue == pvalue
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from scipy.linalg import logm
+
+from dodiscover.ci.kernel_utils import von_neumann_divergence
+
+seed = 12345
+
+
+def test_von_neumann_divergence_eig_tol():
+    """Test the eigendecomposition-based Von Neumann divergence and ``eig_tol``."""
+    rng = np.random.default_rng(seed)
+    C = rng.standard_normal((6, 6))
+    A = C @ C.T / 6 + 0.1 * np.eye(6)
+    D = rng.standard_normal((6, 6))
+    B = D @ D.T / 6 + 0.1 * np.eye(6)
+
+    # the spectral evaluation matches the definition through matrix logarithms
+    expected = np.trace(A @ (logm(A) - logm(B)) - A + B)
+    assert von_neumann_divergence(A, B) == pytest.approx(expected)
+
+    # a tolerance below the smallest eigenvalue keeps the full spectra
+    assert von_neumann_divergence(A, B, eig_tol=1e-8) == pytest.approx(expected)
+
+    # a singular matrix yields a non-finite divergence unless its null space
+    # is discarded through 'eig_tol'
+    E = rng.standard_normal((6, 3))
+    B_singular = E @ E.T / 6
+    with np.errstate(divide="ignore", invalid="ignore"):
+        assert not np.isfinite(von_neumann_divergence(A, B_singular))
+    assert np.isfinite(von_neumann_divergence(A, B_singular, eig_tol=1e-10))
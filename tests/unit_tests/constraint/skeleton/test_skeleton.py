@@ -1,3 +1,5 @@
+import pickle
+
 import networkx as nx
 import numpy as np
 import pandas as pd
@@ -5,7 +7,7 @@ import pytest
 import pywhy_graphs
 
 from dodiscover import ContextBuilder, make_context
-from dodiscover.ci import GSquareCITest, Oracle
+from dodiscover.ci import FisherZCITest, GSquareCITest, Oracle
 from dodiscover.constraint.skeleton import LearnSemiMarkovianSkeleton, LearnSkeleton
 from dodiscover.constraint.utils import dummy_sample
 from dodiscover.testdata.testdata import bin_data, dis_data
@@ -286,3 +288,108 @@ def test_learn_skeleton_pds_disabled_first_stage():
     alg.learn_graph(sample, context)
     assert alg.context_.state_variable("PAG", on_missing="ignore") is None
     assert nx.is_isomorphic(expected_skel, alg.adj_graph_)
+
+
+def test_prescreen_factor_skips_strong_edges():
+    """Test the opt-in prescreen heuristic.
+
+    With ``prescreen_factor`` set, edges whose recorded maximum pvalue is far
+    below ``alpha`` are not re-tested at larger conditioning set sizes, so
+    strongly dependent edges are kept with fewer CI tests. The default of
+    ``None`` leaves the search untouched.
+    """
+    rng = np.random.RandomState(12345)
+    n_samples = 500
+    X = rng.randn(n_samples, 1)
+    X1 = rng.randn(n_samples, 1)
+    Y = X + X1 + 0.5 * rng.randn(n_samples, 1)
+    Z = Y + 0.1 * rng.randn(n_samples, 1)
+    df = pd.DataFrame(np.hstack((X, X1, Y, Z)), columns=["x", "x1", "y", "z"])
+
+    default_alg = LearnSkeleton(ci_estimator=FisherZCITest())
+    assert default_alg.prescreen_factor is None
+    context = make_context().variables(data=df).build()
+    default_alg.learn_graph(df, context)
+
+    prescreen_alg = LearnSkeleton(ci_estimator=FisherZCITest(), prescreen_factor=0.1)
+    context = make_context().variables(data=df).build()
+    prescreen_alg.learn_graph(df, context)
+
+    # the prescreened search runs fewer CI tests and keeps the strongly
+    # dependent edges instead of testing them against larger conditioning sets
+    assert prescreen_alg.n_ci_tests < default_alg.n_ci_tests
+    assert prescreen_alg.adj_graph_.has_edge("y", "z")
+
+
+def test_sep_set_is_picklable():
+    """Test that fitted separating sets survive a pickle round-trip.
+
+    The nested defaultdicts must use module-level factories rather than
+    lambdas, otherwise fitted learners cannot cross process boundaries.
+    """
+    rng = np.random.RandomState(12345)
+    df = pd.DataFrame(rng.randn(100, 3), columns=["x", "y", "z"])
+    alg = LearnSkeleton(ci_estimator=FisherZCITest())
+    context = make_context().variables(data=df).build()
+    alg.learn_graph(df, context)
+
+    clone = pickle.loads(pickle.dumps(alg.sep_set_))
+    assert clone == alg.sep_set_
+
+
+def test_evaluate_edge_ci_cache():
+    """Test that repeat (X, Y, Z) queries are answered from the CI cache."""
+    rng = np.random.RandomState(12345)
+    df = pd.DataFrame(rng.randn(100, 3), columns=["x", "y", "z"])
+
+    ci_estimator = FisherZCITest()
+    alg = LearnSkeleton(ci_estimator=ci_estimator)
+
+    result = alg.evaluate_edge(df, ci_estimator, "x", "y", {"z"})
+    assert (alg.cache_hits_, alg.cache_misses_, alg.n_ci_tests) == (0, 1, 1)
+
+    # the same triple, and the triple with X and Y swapped, are cache hits
+    assert alg.evaluate_edge(df, ci_estimator, "x", "y", {"z"}) == result
+    assert alg.evaluate_edge(df, ci_estimator, "y", "x", {"z"}) == result
+    assert (alg.cache_hits_, alg.cache_misses_, alg.n_ci_tests) == (2, 1, 1)
+
+    # the batch path shares the cache and only runs the uncached sets
+    batch_results = list(alg.evaluate_edge_batch(df, ci_estimator, "x", "y", [{"z"}, set()]))
+    assert batch_results[0] == result
+    assert (alg.cache_hits_, alg.cache_misses_, alg.n_ci_tests) == (3, 2, 2)
+
+
+class ScalarFisherZCITest:
+    """Fisher-Z test without the ``test_batch`` hook, forcing the scalar path."""
+
+    def __init__(self):
+        self._estimator = FisherZCITest()
+
+    def test(self, df, x_vars, y_vars, z_covariates=None):
+        return self._estimator.test(df, set(x_vars), set(y_vars), z_covariates)
+
+
+def test_learn_skeleton_batch_matches_scalar():
+    """Test that the batch CI path matches the scalar path exactly.
+
+    The ``test_batch`` hook must not change the learned skeleton, the
+    separating sets, or the number of CI tests run: batch results are
+    consumed lazily, so the early exit on independence applies to both
+    paths alike.
+    """
+    rng = np.random.RandomState(12345)
+    n_samples = 500
+    X = rng.randn(n_samples, 1)
+    X1 = rng.randn(n_samples, 1)
+    Y = X + X1 + 0.5 * rng.randn(n_samples, 1)
+    Z = Y + 0.1 * rng.randn(n_samples, 1)
+    df = pd.DataFrame(np.hstack((X, X1, Y, Z)), columns=["x", "x1", "y", "z"])
+
+    results = dict()
+    for name, ci_estimator in [("batch", FisherZCITest()), ("scalar", ScalarFisherZCITest())]:
+        alg = LearnSkeleton(ci_estimator=ci_estimator)
+        context = make_context().variables(data=df).build()
+        alg.learn_graph(df, context)
+        results[name] = (set(map(frozenset, alg.adj_graph_.edges)), alg.sep_set_, alg.n_ci_tests)
+
+    assert results["batch"] == results["scalar"]
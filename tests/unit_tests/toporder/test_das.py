@@ -99,3 +99,14 @@ def test_given_custom_nodes_labels_when_fitting_then_input_output_labels_are_con
 
     assert list(model.graph_.nodes()) == labels  # check nodes have custom labels
     assert np.allclose(A_custom, A_default)  # check output not affected by relabeling
+
+
+def test_given_dataset_when_pruning_in_float32_and_float64_then_returns_equal_outputs():
+    X = dummy_sample(seed=seed)
+    context = make_context().variables(observed=X.columns).build()
+    das32 = DAS(min_parents=0)  # default prune_dtype is np.float32
+    das64 = DAS(min_parents=0, prune_dtype=np.float64)
+    das32.learn_graph(X, context)
+    das64.learn_graph(X, context)
+    assert das32.order_ == das64.order_
+    assert np.allclose(nx.to_numpy_array(das32.graph_), nx.to_numpy_array(das64.graph_))